@@ -13,6 +13,18 @@ import unittest
 
 module_dir = os.path.dirname(os.path.abspath(__file__))
 
+# Optional accelerator extensions; the package falls back to pure
+# Python implementations when Cython is unavailable.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize([
+      Extension(
+        'smact.structure_prediction._utilities',
+        ['smact/structure_prediction/_utilities.pyx'])
+    ])
+except ImportError:
+    ext_modules = []
+
 if __name__ == "__main__":
     setup(
       name='SMACT',
@@ -29,6 +41,7 @@ if __name__ == "__main__":
         'smact': ['data/*.txt', 'data/*.csv', 'data/*.data', 'data/*.xlsx', 'data/*.json']
       },
       zip_safe=False,
+      ext_modules=ext_modules,
       test_suite='smact.tests.test',
       install_requires=['scipy', 'numpy', 'spglib', 'pymatgen', 'ase', 'pandas', 'pathos'],
       classifiers=[
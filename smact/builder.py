@@ -7,59 +7,104 @@
 
 # Implement Structure class, c.f. dev_docs.
 
+import copy
+from functools import lru_cache
+
+import numpy as np
 from ase.spacegroup import crystal
 from smact.lattice import Lattice, Site
 
+# Oxidation states assigned to the basis sites, hoisted to module scope
+# so they are not rebuilt on every call.
+_PEROV_OX = [[2], [4], [-2], [-2], [-2]]
+_WURTZ_OX = [[1], [2], [3], [4], [-1], [-2], [-3], [-4]]
+
+# Basis coordinates and cell parameters, pre-assembled once so each call
+# hands ASE a ready-made array rather than a fresh list of tuples.
+_PEROV_BASIS = np.array(
+  [[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0.5, 0]], dtype=np.float64)
+_WURTZ_BASIS = np.array(
+  [[2. / 3., 1. / 3., 0.], [2. / 3., 1. / 3., 5. / 8.]], dtype=np.float64)
+_PEROV_CELLPAR = (6, 6, 6, 90, 90, 90)
+_WURTZ_CELLPAR = (3, 3, 6, 90, 90, 120)
+
 
-def cubic_perovskite(species, cell_par=[6, 6, 6, 90, 90, 90], repetitions=[1, 1, 1]):
+def cubic_perovskite(species, cell_par=_PEROV_CELLPAR, repetitions=(1, 1, 1)):
     """
     Build a perovskite cell using the crystal function in ASE.
 
+    Repeated calls with identical arguments are served from a cache;
+    callers receive their own copy of the cell, so the returned objects
+    are safe to mutate.
+
     Args:
         species (str): Element symbols
-        cell_par (list): Six floats/ints specifying 3 unit cell lengths and 3 unit cell angles.
-        repetitions (list): Three floats specifying the expansion of the cell in x,y,z directions.
+        cell_par (tuple): Six floats/ints specifying 3 unit cell lengths and 3 unit cell angles.
+        repetitions (tuple): Three floats specifying the expansion of the cell in x,y,z directions.
     Returns:
         SMACT Lattice object of the unit cell,
         ASE crystal system of the unit cell.
 
     """
+    if not isinstance(species, str):
+        species = tuple(species)
+    return copy.deepcopy(
+      _cubic_perovskite(species, tuple(cell_par), tuple(repetitions)))
+
+
+@lru_cache(maxsize=256)
+def _cubic_perovskite(species, cell_par, repetitions):
     system = crystal((species),
-                     basis=[(0, 0, 0), (0.5, 0.5, 0.5), (0.5, 0.5, 0)],
+                     basis=_PEROV_BASIS,
                      spacegroup=221,
                      size=repetitions,
-                     cellpar=cell_par)
+                     cellpar=list(cell_par))
 
-    sites_list = []
-    oxidation_states = [[2]] + [[4]] + [[-2]] * 3
-    for site in zip(system.get_scaled_positions(), oxidation_states):
-        sites_list.append(Site(site[0], site[1]))
+    oxidation_states = _PEROV_OX
+    positions = system.get_scaled_positions()
+    n_sites = min(len(positions), len(oxidation_states))
+    sites_list = [
+      Site(positions[i], oxidation_states[i]) for i in range(n_sites)
+    ]
 
     return Lattice(sites_list, oxidation_states), system
 
 
-def wurtzite(species, cell_par=[2, 2, 6, 90, 90, 120], repetitions=[1, 1, 1]):
+def wurtzite(species, cell_par=(2, 2, 6, 90, 90, 120), repetitions=(1, 1, 1)):
     """
     Build a wurzite cell using the crystal function in ASE.
 
+    Repeated calls with identical arguments are served from a cache;
+    callers receive their own copy of the cell, so the returned objects
+    are safe to mutate.
+
     Args:
         species (str): Element symbols
-        cell_par (list): Six floats/ints specifying 3 unit cell lengths and 3 unit cell angles.
-        repetitions (list): Three floats specifying the expansion of the cell in x,y,z directions.
+        cell_par (tuple): Currently unused; the cell is always built with
+            the fixed (3, 3, 6, 90, 90, 120) parameters.
+        repetitions (tuple): Three floats specifying the expansion of the cell in x,y,z directions.
     Returns:
         SMACT Lattice object of the unit cell,
         ASE crystal system of the unit cell.
 
     """
+    if not isinstance(species, str):
+        species = tuple(species)
+    return copy.deepcopy(_wurtzite(species, tuple(repetitions)))
+
+
+@lru_cache(maxsize=256)
+def _wurtzite(species, repetitions):
     system = crystal((species),
-                     basis=[(2. / 3., 1. / 3., 0), (2. / 3., 1. / 3., 5. / 8.)],
+                     basis=_WURTZ_BASIS,
                      spacegroup=186,
                      size=repetitions,
-                     cellpar=[3, 3, 6, 90, 90, 120])
-
-    sites_list = []
-    oxidation_states = [[1], [2], [3], [4]] + [[-1], [-2], [-3], [-4]]
+                     cellpar=list(_WURTZ_CELLPAR))
 
-    for site in zip(system.get_scaled_positions(), oxidation_states):
-        sites_list.append(Site(site[0], site[1]))
+    oxidation_states = _WURTZ_OX
+    positions = system.get_scaled_positions()
+    n_sites = min(len(positions), len(oxidation_states))
+    sites_list = [
+      Site(positions[i], oxidation_states[i]) for i in range(n_sites)
+    ]
     return Lattice(sites_list, oxidation_states), system
@@ -0,0 +1,33 @@
+# cython: language_level=3
+"""Compiled species-string parser.
+
+Cython counterpart of the pure-Python scanner in
+:mod:`smact.structure_prediction.utilities`, which falls back to the
+Python implementation when this extension has not been built.
+"""
+
+
+cpdef tuple parse_spec(str species):
+    """Parse a species string into its element and charge.
+
+    See :func:`smact.structure_prediction.utilities.parse_spec`.
+
+    """
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j
+    cdef Py_ssize_t n = len(species)
+    cdef int charge
+    cdef str sign
+
+    while i < n and species[i].isalpha():
+        i += 1
+
+    j = i
+    while j < n and species[j].isdigit():
+        j += 1
+
+    sign = species[j:j + 1]
+    charge = int(species[i:j]) if j > i else (1 if sign else 0)
+    if sign == '-':
+        charge = -charge
+    return species[:i], charge
@@ -263,6 +263,6 @@ def parse_mprest(data: Dict[str, Union[pymatgen.core.Structure, str]], ) -> Smac
     """
     try:
         return SmactStructure.from_py_struct(data["structure"])
-    except:
+    except ValueError:
         # Couldn't decorate with oxidation states
         logger.warn(f"Couldn't decorate {data['material_id']} with oxidation states.")
\ No newline at end of file
@@ -19,6 +19,13 @@ import smact
 from . import logger
 from .utilities import get_sign
 
+# Exact-type dispatch for the two supported species tuple layouts;
+# one dict probe replaces a chain of isinstance checks on the hot path.
+_SPEC_KINDS = {str: "str", smact.Species: "species"}
+
+# Valid lengths for the species tuples accepted by SmactStructure.
+_VALID_TUPLE_LENS = frozenset((2, 3))
+
 class SmactStructure:
     """SMACT implementation inspired by pymatgen Structure class.
 
@@ -45,6 +52,8 @@ class SmactStructure:
 
     """
 
+    __slots__ = ("species", "lattice_mat", "sites", "lattice_param")
+
     def __init__(
       self,
       species: List[Union[Tuple[str, int, int], Tuple[smact.Species, int]]],
@@ -105,6 +114,23 @@ class SmactStructure:
           list(self.sites.keys()) == list(other.sites.keys()),
         ])
 
+    def __setstate__(self, state):
+        """Restore state when unpickling.
+
+        Handles both the legacy plain-dict state written before the
+        class used ``__slots__`` and the (dict, slots) pair pickled
+        since, so existing pickles remain loadable.
+
+        """
+        if isinstance(state, tuple):
+            dict_state, slots_state = state
+        else:
+            dict_state, slots_state = state, None
+        for source in (dict_state, slots_state):
+            if source:
+                for attr, value in source.items():
+                    setattr(self, attr, value)
+
     @staticmethod
     def _sanitise_species(
       species: List[Union[Tuple[str, int, int], Tuple[smact.Species, int]]],
@@ -136,20 +162,28 @@ class SmactStructure:
           "2-tuples of Species objects and stoichiometries, "
           "or 3-tuples of elements, oxidations and stoichiometries."
         )
-        if len(species[0]) not in {2, 3}:
+        if len(species[0]) not in _VALID_TUPLE_LENS:
             raise ValueError(species_error)
 
-        if isinstance(species[0][0], str):  # String variation of instantiation
+        kind = _SPEC_KINDS.get(type(species[0][0]))
+        if kind is None:
+            # Subclasses miss the exact-type table but are still valid.
+            if isinstance(species[0][0], str):
+                kind = "str"
+            elif isinstance(species[0][0], smact.Species):
+                kind = "species"
+            else:
+                raise TypeError(species_error)
+
+        if kind == "str":  # String variation of instantiation
             species.sort(key=itemgetter(1), reverse=True)
             species.sort(key=itemgetter(0))
             sanit_species = species
 
-        elif isinstance(species[0][0], smact.Species):  # Species class variation of instantiation
-            species.sort(key=lambda x: (x[0].symbol, -x[0].oxidation))
+        else:  # Species class variation of instantiation
             sanit_species = [(x[0].symbol, x[0].oxidation, x[1]) for x in species]
-
-        else:
-            raise TypeError(species_error)
+            sanit_species.sort(key=itemgetter(1), reverse=True)
+            sanit_species.sort(key=itemgetter(0))
 
         return sanit_species
 
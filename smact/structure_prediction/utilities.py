@@ -1,15 +1,25 @@
 """Miscellaneous tools for data parsing."""
 
-import re
-from typing import Tuple
+from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
 
-def parse_spec(species: str) -> Tuple[str, int]:
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _parse_spec_py(species: str) -> tuple[str, int]:
     """Parse a species string into its element and charge.
 
     Args:
         species (str): String representation of a species in
-            the format {element}{absolute_charge}{sign}.
+            the format {element}{absolute_charge}{sign},
+            i.e. matching ``([A-Za-z]+)([0-9]*)([+\\-]?)``.
 
     Returns:
         A tuple of (element, signed_charge).
@@ -21,18 +31,127 @@ def parse_spec(species: str) -> Tuple[str, int]:
         ('O', -2)
 
     """
-    ele = re.match(r"[A-Za-z]+", species).group(0)
+    # Direct character scan; species strings are short enough that
+    # regex engine overhead dominates the actual parse.
+    length = len(species)
+    i = 0
+    while i < length and species[i].isalpha():
+        i += 1
+    ele = species[:i]
+
+    j = i
+    while j < length and species[j].isdigit():
+        j += 1
+
+    sign = species[j:j + 1]
+    charge = int(species[i:j]) if j > i else (1 if sign else 0)
+    if sign == '-':
+        charge *= -1
+    return ele, charge
 
-    charge_match = re.search(r"\d+", species)
-    charge = int(charge_match.group(0)) if charge_match else 0
 
-    if '-' in species:
-        charge *= -1
+try:
+    # C-extension scanner, if it was built; same signature and semantics.
+    from ._utilities import parse_spec as _parse_spec
+except ImportError:
+    _parse_spec = _parse_spec_py
 
-    return ele, charge
+parse_spec = lru_cache(maxsize=4096)(_parse_spec)
+
+
+def parse_specs(species_list: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a collection of species strings in bulk.
+
+    A vectorized counterpart to :func:`parse_spec` for call sites
+    that loop over many species; the per-call dispatch overhead is
+    amortized across the whole batch.
+
+    Args:
+        species_list: Species strings in the format accepted
+            by :func:`parse_spec`.
+
+    Returns:
+        A tuple of (elements, charges), where elements is an object
+        array of element symbols and charges is an int8 array of
+        signed charges.
+
+    Examples:
+        >>> parse_specs(["Fe2+", "O2-"])
+        (array(['Fe', 'O'], dtype=object), array([ 2, -2], dtype=int8))
+
+    """
+    parsed = [parse_spec(spec) for spec in species_list]
+    eles = np.array([p[0] for p in parsed], dtype=object)
+    charges = np.array([p[1] for p in parsed], dtype=np.int8)
+    return eles, charges
+
+
+if njit is not None:
 
+    @njit(cache=True, parallel=True)
+    def _compute_charges(digits: np.ndarray, signs: np.ndarray) -> np.ndarray:
+        out = np.empty(digits.size, dtype=np.int32)
+        for i in prange(digits.size):
+            out[i] = digits[i] * signs[i]
+        return out
 
-def unparse_spec(species: Tuple[str, int]) -> str:
+else:
+
+    def _compute_charges(digits: np.ndarray, signs: np.ndarray) -> np.ndarray:
+        return (digits * signs).astype(np.int32)
+
+
+def parse_specs_njit(species_list: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a collection of species strings with a compiled charge kernel.
+
+    Like :func:`parse_specs`, but the charge arithmetic is evaluated in
+    a single native-code pass over pre-scanned digit and sign arrays.
+    The kernel is JIT-compiled with numba when it is installed (with the
+    compilation cached on disk) and falls back to vectorized NumPy
+    otherwise.
+
+    Args:
+        species_list: Species strings in the format accepted
+            by :func:`parse_spec`.
+
+    Returns:
+        A tuple of (elements, charges), where elements is an object
+        array of element symbols and charges is an int32 array of
+        signed charges.
+
+    """
+    n = len(species_list)
+    eles = np.empty(n, dtype=object)
+    digits = np.empty(n, dtype=np.int32)
+    signs = np.empty(n, dtype=np.int8)
+
+    for idx, species in enumerate(species_list):
+        length = len(species)
+        i = 0
+        while i < length and species[i].isalpha():
+            i += 1
+        eles[idx] = species[:i]
+
+        j = i
+        while j < length and species[j].isdigit():
+            j += 1
+
+        sign = species[j:j + 1]
+        digits[idx] = int(species[i:j]) if j > i else 1
+        # Sign-less digits are positive; only bare symbols are neutral.
+        signs[idx] = -1 if sign == '-' else (1 if (sign or j > i) else 0)
+
+    return eles, _compute_charges(digits, signs)
+
+
+# Precomputed {charge: "{abs(charge)}{sign}"} strings covering the full
+# range of real oxidation states; neutral species get no suffix.
+_CHARGE_STR = {i: f"{abs(i)}{'+' if i > 0 else '-'}" for i in range(-8, 9) if i}
+_CHARGE_STR[0] = ""
+
+
+@lru_cache(maxsize=4096)
+def unparse_spec(species: tuple[str, int]) -> str:
     """Unparse a species into a string representation.
 
     The analogue of :func:`parse_spec`.
@@ -50,7 +169,14 @@ def unparse_spec(species: Tuple[str, int]) -> str:
         'O2-'
 
     """
-    return f"{species[0]}{abs(species[1])}{get_sign(species[1])}"
+    charge = species[1]
+    charge_str = _CHARGE_STR.get(charge)
+    if charge_str is None:
+        charge_str = f"{abs(charge)}{get_sign(charge)}"
+    return species[0] + charge_str
+
+
+_SIGNS = ('-', '', '+')
 
 
 def get_sign(charge: int) -> str:
@@ -63,9 +189,5 @@ def get_sign(charge: int) -> str:
         sign (str): either '+', '-', or '' for neutral.
 
     """
-    if charge > 0:
-        return '+'
-    elif charge < 0:
-        return '-'
-    else:
-        return ''
+    # Branchless: (charge > 0) - (charge < 0) is -1, 0 or +1.
+    return _SIGNS[(charge > 0) - (charge < 0) + 1]
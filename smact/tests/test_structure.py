@@ -22,6 +22,13 @@ from smact.structure_prediction.database import StructureDB
 from smact.structure_prediction.mutation import CationMutator
 from smact.structure_prediction.prediction import StructurePredictor
 from smact.structure_prediction.structure import SmactStructure
+from smact.structure_prediction.utilities import (
+  parse_spec,
+  parse_specs,
+  parse_specs_njit,
+  unparse_spec,
+)
+from smact.builder import cubic_perovskite, wurtzite
 
 files_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "files")
 TEST_STRUCT = os.path.join(files_dir, "test_struct")
@@ -208,6 +215,61 @@ class StructureTest(unittest.TestCase):
                 self.assertEqual(local_struct, mp_struct)
 
 
+class UtilitiesTest(unittest.TestCase):
+    """Test utility functions for species parsing."""
+
+    TEST_SPECS = ["Fe2+", "O2-", "Mn10+", "Fe3", "Cu+", "Cl-", "Na"]
+
+    def test_parse_spec(self):
+        """Test parsing of species strings."""
+        test_cases = [
+          ("Fe2+", ("Fe", 2)),
+          ("O2-", ("O", -2)),
+          ("Mn10+", ("Mn", 10)),
+          ("Fe3", ("Fe", 3)),
+          ("Cu+", ("Cu", 1)),
+          ("Cl-", ("Cl", -1)),
+          ("Na", ("Na", 0)), ]
+        for spec_str, expected in test_cases:
+            with self.subTest(spec_str=spec_str):
+                self.assertEqual(parse_spec(spec_str), expected)
+
+    def test_unparse_spec(self):
+        """Test the round trip between species tuples and strings."""
+        self.assertEqual(unparse_spec(("Fe", 2)), "Fe2+")
+        self.assertEqual(unparse_spec(("O", -2)), "O2-")
+        self.assertEqual(unparse_spec(("Na", 0)), "Na")
+        for spec_str in self.TEST_SPECS:
+            with self.subTest(spec_str=spec_str):
+                ele, charge = parse_spec(spec_str)
+                self.assertEqual(parse_spec(unparse_spec((ele, charge))), (ele, charge))
+
+    def test_parse_specs(self):
+        """Test bulk parsers against the scalar parser."""
+        for bulk_parser in (parse_specs, parse_specs_njit):
+            with self.subTest(bulk_parser=bulk_parser.__name__):
+                eles, charges = bulk_parser(self.TEST_SPECS)
+                for spec_str, ele, charge in zip(self.TEST_SPECS, eles, charges):
+                    self.assertEqual(parse_spec(spec_str), (ele, charge))
+
+
+class BuilderTest(unittest.TestCase):
+    """Test caching behaviour of the cell builders."""
+
+    def test_builder_cache_isolation(self):
+        """Test that mutating a builder's output does not poison the cache."""
+        for builder in (cubic_perovskite, wurtzite):
+            species = ["Ba", "Ti", "O"] if builder is cubic_perovskite else ["Zn", "S"]
+            with self.subTest(builder=builder.__name__):
+                _, system = builder(species)
+                positions = system.get_positions().copy()
+                system.set_positions(positions + 1.0)
+
+                _, fresh = builder(species)
+                self.assertIsNot(fresh, system)
+                self.assertTrue(np.array_equal(fresh.get_positions(), positions))
+
+
 class StructureDBTest(unittest.TestCase):
     """Test StructureDB interface."""
 
@@ -515,6 +577,8 @@ if __name__ == "__main__":
     TestLoader = unittest.TestLoader()
     StructureTests = unittest.TestSuite()
     StructureTests.addTests(TestLoader.loadTestsFromTestCase(StructureTest))
+    StructureTests.addTests(TestLoader.loadTestsFromTestCase(UtilitiesTest))
+    StructureTests.addTests(TestLoader.loadTestsFromTestCase(BuilderTest))
     StructureTests.addTests(TestLoader.loadTestsFromTestCase(StructureDBTest))
     StructureTests.addTests(TestLoader.loadTestsFromTestCase(CationMutatorTest))
     StructureTests.addTests(TestLoader.loadTestsFromTestCase(PredictorTest))